@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Memory used by a classify() response with the regular dict body and with compact=True. Both the
+# parsed body and the raw responses kept by MonkeyLearnResponse are measured.
+#
+#     python benchmarks/compact_memory.py [DOCUMENTS] [BATCH_SIZE]
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+
+from monkeylearn.compact import CompactClassificationBody
+from monkeylearn.response import MonkeyLearnResponse
+from monkeylearn.transports import build_response
+
+TAGS = [('Positive', 1994), ('Negative', 1941), ('Neutral', 1990)]
+HEADERS = {
+    'X-Query-Limit-Limit': '10000000',
+    'X-Query-Limit-Remaining': '5000000',
+}
+
+
+def make_payloads(documents, batch_size):
+    payloads = []
+    for start in range(0, documents, batch_size):
+        payloads.append(json.dumps([
+            {
+                'text': 'Review number {} of the hotel, the room was fine'.format(i),
+                'external_id': str(i),
+                'error': False,
+                'classifications': [
+                    {'tag_name': name, 'tag_id': tag_id, 'confidence': round(random.random(), 3)}
+                    for name, tag_id in TAGS[:2]
+                ],
+            }
+            for i in range(start, min(start + batch_size, documents))
+        ]))
+    return payloads
+
+
+def measure(payloads, compact_body_class):
+    gc.collect()
+    tracemalloc.start()
+    response = MonkeyLearnResponse(compact_body_class=compact_body_class)
+    for payload in payloads:
+        response.add_raw_response(build_response(200, payload, headers=HEADERS))
+    assert len(response.body) > 0
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    payloads = make_payloads(documents, batch_size)
+
+    dict_memory = measure(payloads, None)
+    compact_memory = measure(payloads, CompactClassificationBody)
+
+    print('{} documents, batches of {}'.format(documents, batch_size))
+    print('dict body:    {:8.1f} MB'.format(dict_memory / 1e6))
+    print('compact body: {:8.1f} MB ({:.1f}x smaller)'.format(
+        compact_memory / 1e6, dict_memory / compact_memory))
+
+
+if __name__ == '__main__':
+    main()
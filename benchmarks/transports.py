@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Throughput of RequestsTransport and HTTP2Transport when many threads share one client. The
+# stand-in servers answer every classify request after a fixed delay: an HTTP/1.1 server for
+# requests and a cleartext HTTP/2 (prior knowledge) server for httpx. classify() sends its
+# batches one after another, so concurrency comes from the caller threads.
+#
+#     pip install monkeylearn[http2]
+#     python benchmarks/transports.py [THREADS] [CALLS_PER_THREAD] [DELAY_SECONDS]
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import json
+import socket
+import sys
+import threading
+import time
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+import h2.config
+import h2.connection
+import h2.events
+
+from monkeylearn import MonkeyLearn
+from monkeylearn.transports import HTTP2Transport, RequestsTransport
+
+DELAY = 0.02
+TEXTS_PER_CALL = 20
+BATCH_SIZE = 10
+
+
+def classify_payload(request_body):
+    texts = json.loads(request_body.decode('utf-8'))['data']
+    body = json.dumps([
+        {
+            'text': text,
+            'external_id': None,
+            'error': False,
+            'classifications': [{'tag_name': 'Positive', 'tag_id': 1, 'confidence': 0.9}],
+        }
+        for text in texts
+    ]).encode('utf-8')
+    headers = {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(body)),
+        'X-Query-Limit-Limit': '1000000',
+        'X-Query-Limit-Remaining': '500000',
+        'X-Query-Limit-Request-Queries': str(len(texts)),
+    }
+    return body, headers
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class HTTP1Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        request_body = self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(DELAY)
+        body, headers = classify_payload(request_body)
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_http1_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), HTTP1Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return 'http://127.0.0.1:{}/'.format(server.server_port)
+
+
+class HTTP2Connection(object):
+    def __init__(self, sock):
+        self.sock = sock
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        self.lock = threading.Lock()
+        self.request_bodies = {}
+
+    def flush(self):
+        data = self.connection.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def respond(self, stream_id, request_body):
+        time.sleep(DELAY)
+        body, headers = classify_payload(request_body)
+        with self.lock:
+            response_headers = [(':status', '200')]
+            response_headers.extend((name.lower(), value) for name, value in headers.items())
+            self.connection.send_headers(stream_id, response_headers)
+            self.connection.send_data(stream_id, body, end_stream=True)
+            self.flush()
+
+    def serve(self):
+        with self.lock:
+            self.connection.initiate_connection()
+            self.flush()
+        while True:
+            data = self.sock.recv(65535)
+            if not data:
+                break
+            with self.lock:
+                for event in self.connection.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        self.request_bodies[event.stream_id] = b''
+                    elif isinstance(event, h2.events.DataReceived):
+                        self.request_bodies[event.stream_id] += event.data
+                        self.connection.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        thread = threading.Thread(
+                            target=self.respond,
+                            args=(event.stream_id, self.request_bodies.pop(event.stream_id)),
+                        )
+                        thread.daemon = True
+                        thread.start()
+                self.flush()
+
+
+def start_http2_server():
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(16)
+
+    def accept():
+        while True:
+            sock, _ = listener.accept()
+            thread = threading.Thread(target=HTTP2Connection(sock).serve)
+            thread.daemon = True
+            thread.start()
+
+    thread = threading.Thread(target=accept)
+    thread.daemon = True
+    thread.start()
+    return 'http://127.0.0.1:{}/'.format(listener.getsockname()[1])
+
+
+def run(ml, threads, calls):
+    def work():
+        for _ in range(calls):
+            response = ml.classifiers.classify('cl_benchmark', ['text'] * TEXTS_PER_CALL,
+                                               batch_size=BATCH_SIZE)
+            assert len(response.body) == TEXTS_PER_CALL
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.time() - start
+
+
+def main():
+    global DELAY
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    if len(sys.argv) > 3:
+        DELAY = float(sys.argv[3])
+
+    requests_count = threads * calls * TEXTS_PER_CALL // BATCH_SIZE
+    print('{} threads, {} requests, {:.0f} ms server delay'.format(
+        threads, requests_count, DELAY * 1000))
+
+    transports = [
+        ('RequestsTransport', start_http1_server(), RequestsTransport()),
+        # Cleartext HTTP/2 needs prior knowledge, so HTTP/1.1 is disabled
+        ('HTTP2Transport', start_http2_server(), HTTP2Transport(http1=False)),
+    ]
+    for name, base_url, transport in transports:
+        elapsed = run(MonkeyLearn('token', base_url=base_url, transport=transport), threads, calls)
+        print('{:18} {:6.2f} s {:8.1f} requests/s'.format(name, elapsed, requests_count / elapsed))
+        transport.close()
+
+
+if __name__ == '__main__':
+    main()
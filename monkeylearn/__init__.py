@@ -3,29 +3,39 @@ from __future__ import print_function, unicode_literals, division, absolute_impo
 
 from monkeylearn.settings import DEFAULT_BASE_URL
 from monkeylearn.classification import Classification
+from monkeylearn.concurrency import ForkSafe
 from monkeylearn.extraction import Extraction
+from monkeylearn.latency import LatencyTracker
+from monkeylearn.transports import RequestsTransport
 from monkeylearn.workflows import Workflows
 
 
-class MonkeyLearn(object):
-    def __init__(self, token, base_url=DEFAULT_BASE_URL):
+class MonkeyLearn(ForkSafe):
+    def __init__(self, token, base_url=DEFAULT_BASE_URL, transport=None, hedging=None,
+                 scheduler=None):
         self.token = token
         self.base_url = base_url
+        if transport is None:
+            transport = RequestsTransport()
+        self.transport = transport
+        self.hedging = hedging
+        self.batch_latency = LatencyTracker()
+        self.scheduler = scheduler
+        super(MonkeyLearn, self).__init__()
+
+    def get_endpoint_set(self, endpoint_set_class):
+        return endpoint_set_class(token=self.token, base_url=self.base_url,
+                                  transport=self.transport, hedging=self.hedging,
+                                  batch_latency=self.batch_latency, scheduler=self.scheduler)
 
     @property
     def classifiers(self):
-        if not hasattr(self, '_classifiers'):
-            self._classifiers = Classification(token=self.token, base_url=self.base_url)
-        return self._classifiers
+        return self.get_or_create('_classifiers', self.get_endpoint_set, Classification)
 
     @property
     def extractors(self):
-        if not hasattr(self, '_extractors'):
-            self._extractors = Extraction(token=self.token, base_url=self.base_url)
-        return self._extractors
+        return self.get_or_create('_extractors', self.get_endpoint_set, Extraction)
 
     @property
     def workflows(self):
-        if not hasattr(self, '_workflows'):
-            self._workflows = Workflows(token=self.token, base_url=self.base_url)
-        return self._workflows
+        return self.get_or_create('_workflows', self.get_endpoint_set, Workflows)
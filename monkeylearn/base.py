@@ -2,14 +2,20 @@
 from __future__ import print_function, unicode_literals, division, absolute_import
 
 import json
+import threading
 import time
 import pkg_resources
 
 import six
+from six.moves import queue
 from six.moves.urllib.parse import urlencode
-import requests
 
+from monkeylearn.concurrency import ForkSafe
+from monkeylearn.exceptions import RequestTimeoutError
+from monkeylearn.latency import LatencyTracker, now
+from monkeylearn.scheduler import PRIORITY_NORMAL
 from monkeylearn.settings import DEFAULT_BASE_URL
+from monkeylearn.transports import RequestsTransport
 
 try:
     version = pkg_resources.get_distribution('monkeylearn').version
@@ -17,10 +23,25 @@ except Exception:
     version = 'noversion'
 
 
-class ModelEndpointSet(object):
-    def __init__(self, token, base_url=DEFAULT_BASE_URL):
+class ModelEndpointSet(ForkSafe):
+    def __init__(self, token, base_url=DEFAULT_BASE_URL, transport=None, hedging=None,
+                 batch_latency=None, scheduler=None):
         self.token = token
         self.base_url = base_url
+        if transport is None:
+            transport = RequestsTransport()
+        self.transport = transport
+        self.hedging = hedging
+        if batch_latency is None:
+            batch_latency = LatencyTracker()
+        self.batch_latency = batch_latency
+        self.scheduler = scheduler
+        super(ModelEndpointSet, self).__init__()
+
+    def get_nested_endpoint_set(self, endpoint_set_class):
+        return endpoint_set_class(self.token, self.base_url, transport=self.transport,
+                                  hedging=self.hedging, batch_latency=self.batch_latency,
+                                  scheduler=self.scheduler)
 
     def _add_action_or_query_string(self, url, action, query_string):
         if action is not None:
@@ -47,18 +68,42 @@ class ModelEndpointSet(object):
         url = '{}{}/'.format(self.get_nested_list_url(parent_id, action=None), children_id)
         return self._add_action_or_query_string(url, action, query_string)
 
-    def make_request(self, method, url, data=None, retry_if_throttled=True, params=None):
+    def get_deadline(self, timeout):
+        if timeout is None:
+            return None
+        return now() + timeout
+
+    def make_request(self, method, url, data=None, retry_if_throttled=True, params=None,
+                     deadline=None, priority=PRIORITY_NORMAL, cost=0, track_latency=False):
         if data is not None:
             data = json.dumps(data)
 
         retries_left = 3
         while retries_left:
-
-            response = requests.request(method, url, data=data, params=params, headers={
-                'Authorization': 'Token ' + self.token,
-                'Content-Type': 'application/json',
-                'User-Agent': 'python-sdk-{}'.format(version),
-            })
+            if self.scheduler is not None:
+                ticket = self.scheduler.acquire(priority=priority, cost=cost, deadline=deadline)
+
+            response = None
+            try:
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - now()
+                    if timeout <= 0:
+                        raise RequestTimeoutError()
+
+                start = now()
+                response = self.transport.request(method, url, data=data, params=params, headers={
+                    'Authorization': 'Token ' + self.token,
+                    'Content-Type': 'application/json',
+                    'User-Agent': 'python-sdk-{}'.format(version),
+                }, timeout=timeout)
+                # Only the request itself is measured, not the scheduler queue or throttling waits
+                if track_latency:
+                    self.batch_latency.add(now() - start)
+            finally:
+                # The slot is released before any throttling wait
+                if self.scheduler is not None:
+                    self.scheduler.release(ticket, cost=cost, response=response)
 
             if response.content:
                 body = response.json()
@@ -70,7 +115,11 @@ class ModelEndpointSet(object):
                 if error_code in ('PLAN_RATE_LIMIT', 'CONCURRENCY_RATE_LIMIT'):
                     wait = int(body.get('seconds_to_wait', 2))
 
-                if wait:
+                if wait and self.scheduler is not None:
+                    self.scheduler.throttle(wait)
+
+                # Don't wait past the deadline, the throttled response is returned instead
+                if wait and (deadline is None or now() + wait < deadline):
                     time.sleep(wait)
                     retries_left -= 1
                     continue
@@ -78,5 +127,70 @@ class ModelEndpointSet(object):
             return response
         return response
 
+    def make_batch_request(self, url, data, retry_if_throttled=True, deadline=None,
+                           priority=PRIORITY_NORMAL):
+        # Each text uses one plan query
+        request_kwargs = dict(retry_if_throttled=retry_if_throttled, deadline=deadline,
+                              priority=priority, cost=len(data['data']))
+        if self.hedging is None and deadline is None:
+            return self.make_request('POST', url, data, track_latency=True, **request_kwargs)
+        return self.make_hedged_request(url, data, **request_kwargs)
+
+    def make_hedged_request(self, url, data, retry_if_throttled=True, deadline=None,
+                            priority=PRIORITY_NORMAL, cost=0):
+        # The request runs in a separate thread, so the deadline is a hard cap even if the
+        # transport timeout (per connect or read for requests) isn't. Without a hedging policy
+        # no duplicate is sent.
+        delay = None
+        if self.hedging is not None:
+            self.hedging.add_batch()
+            delay = self.hedging.get_delay(self.batch_latency)
+        results = queue.Queue()
+
+        def send():
+            try:
+                results.put((True, self.make_request('POST', url, data,
+                                                     retry_if_throttled=retry_if_throttled,
+                                                     deadline=deadline, priority=priority,
+                                                     cost=cost, track_latency=True)))
+            except Exception as e:
+                results.put((False, e))
+
+        def start_request():
+            thread = threading.Thread(target=send)
+            thread.daemon = True
+            thread.start()
+
+        start_request()
+        pending = 1
+        hedged = False
+        error = None
+        while pending:
+            timeout = None
+            if deadline is not None:
+                timeout = max(deadline - now(), 0)
+            if not hedged and delay is not None:
+                timeout = delay if timeout is None else min(timeout, delay)
+
+            try:
+                succeeded, result = results.get(timeout=timeout)
+            except queue.Empty:
+                if deadline is not None and now() >= deadline:
+                    raise RequestTimeoutError()
+                # The batch is slower than usual, send a duplicate if the budget allows it and
+                # keep the first answer
+                hedged = True
+                if self.hedging.acquire_hedge():
+                    start_request()
+                    pending += 1
+                continue
+
+            pending -= 1
+            if succeeded:
+                return result
+            if error is None:
+                error = result
+        raise error
+
     def remove_none_value(self, d):
         return {k: v for k, v in six.iteritems(d) if v is not None}
@@ -4,9 +4,18 @@ from __future__ import print_function, unicode_literals, division, absolute_impo
 from six.moves import range
 
 from monkeylearn.base import ModelEndpointSet
+from monkeylearn.columnar import (
+    CLASSIFICATION_COLUMNS, ColumnBuilder, add_classification_results, get_column_index,
+    get_texts, guess_output_format, iter_column_batches
+)
+from monkeylearn.compact import CompactClassificationBody
+from monkeylearn.exceptions import QueryBudgetExceededError, RequestTimeoutError
 from monkeylearn.response import MonkeyLearnResponse
+from monkeylearn.scheduler import PRIORITY_NORMAL
 from monkeylearn.settings import DEFAULT_BATCH_SIZE
-from monkeylearn.validation import validate_batch_size, validate_order_by_param
+from monkeylearn.validation import (
+    validate_batch_size, validate_order_by_param, validate_output_format, validate_priority
+)
 
 
 class Classification(ModelEndpointSet):
@@ -14,9 +23,7 @@ class Classification(ModelEndpointSet):
 
     @property
     def tags(self):
-        if not hasattr(self, '_tags'):
-            self._tags = Tags(self.token, self.base_url)
-        return self._tags
+        return self.get_or_create('_tags', self.get_nested_endpoint_set, Tags)
 
     def list(self, page=None, per_page=None, order_by=None, retry_if_throttled=True):
         if order_by is not None:
@@ -96,23 +103,51 @@ class Classification(ModelEndpointSet):
         return MonkeyLearnResponse(response)
 
     def classify(self, model_id, data, production_model=False, batch_size=DEFAULT_BATCH_SIZE,
-                 auto_batch=True, retry_if_throttled=True):
+                 auto_batch=True, retry_if_throttled=True, compact=False,
+                 timeout=None, priority=PRIORITY_NORMAL):
         validate_batch_size(batch_size)
+        validate_priority(priority)
 
         url = self.get_detail_url(model_id, action='classify')
 
-        response = MonkeyLearnResponse()
+        deadline = self.get_deadline(timeout)
+        response = MonkeyLearnResponse(
+            compact_body_class=CompactClassificationBody if compact else None
+        )
         for i in range(0, len(data), batch_size):
             data_dict = self.remove_none_value({
                 'data': data[i:i + batch_size],
                 'production_model': production_model,
             })
-            raw_response = self.make_request('POST', url, data_dict,
-                                             retry_if_throttled=retry_if_throttled)
+            try:
+                raw_response = self.make_batch_request(url, data_dict,
+                                                       retry_if_throttled=retry_if_throttled,
+                                                       deadline=deadline, priority=priority)
+            except (RequestTimeoutError, QueryBudgetExceededError) as e:
+                e.response = response
+                raise
             response.add_raw_response(raw_response)
 
         return response
 
+    def classify_column(self, model_id, column, production_model=False,
+                        batch_size=DEFAULT_BATCH_SIZE, retry_if_throttled=True,
+                        output_format=None, priority=PRIORITY_NORMAL):
+        validate_batch_size(batch_size)
+        validate_priority(priority)
+        if output_format is None:
+            output_format = guess_output_format(column)
+        validate_output_format(output_format)
+
+        builder = ColumnBuilder(CLASSIFICATION_COLUMNS)
+        for batch in iter_column_batches(column, batch_size):
+            response = self.classify(model_id, get_texts(batch),
+                                     production_model=production_model, batch_size=batch_size,
+                                     retry_if_throttled=retry_if_throttled, priority=priority)
+            add_classification_results(builder, batch, response.body)
+
+        return builder.build(output_format, index=get_column_index(column))
+
     def upload_data(self, model_id, data, input_duplicates_strategy=None,
                     existing_duplicates_strategy=None, retry_if_throttled=True):
         url = self.get_detail_url(model_id, action='data')
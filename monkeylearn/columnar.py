@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import math
+import sys
+
+from six.moves import range
+
+from monkeylearn.exceptions import MonkeyLearnLocalException
+from monkeylearn.settings import OUTPUT_ARROW, OUTPUT_DICT, OUTPUT_PANDAS
+
+
+CLASSIFICATION_COLUMNS = ('tag_name', 'tag_id', 'confidence', 'error')
+EXTRACTION_COLUMNS = ('row', 'tag_name', 'extracted_text', 'parsed_value', 'start', 'end')
+
+
+# pandas and pyarrow are optional and slow to import, they are only imported to build an output
+# in their format. A column can only be one of their types if they were already imported.
+def is_pandas_column(column):
+    pandas = sys.modules.get('pandas')
+    return pandas is not None and isinstance(column, (pandas.Series, pandas.Index))
+
+
+def is_arrow_column(column):
+    pyarrow = sys.modules.get('pyarrow')
+    return pyarrow is not None and isinstance(column, (pyarrow.Array, pyarrow.ChunkedArray))
+
+
+def get_column_index(column):
+    # Lists and Arrow arrays have an index() method, and a pandas Index has no index at all
+    pandas = sys.modules.get('pandas')
+    if pandas is not None and isinstance(column, pandas.Series):
+        return column.index
+    return None
+
+
+def guess_output_format(column):
+    if is_pandas_column(column):
+        return OUTPUT_PANDAS
+    if is_arrow_column(column):
+        return OUTPUT_ARROW
+    return OUTPUT_DICT
+
+
+def is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def iter_column_batches(column, batch_size):
+    # Only one batch is converted to Python objects at a time. Missing values (None, NaN, Arrow
+    # nulls and pandas NA) are yielded as None, they can't be sent to the API.
+    for i in range(0, len(column), batch_size):
+        if is_pandas_column(column):
+            # Series slices by label with some indexes, iloc is always positional (an Index has
+            # no iloc, but it always slices by position)
+            values = getattr(column, 'iloc', column)[i:i + batch_size]
+            batch = [None if missing else value
+                     for value, missing in zip(values.tolist(), values.isna().tolist())]
+        elif is_arrow_column(column):
+            batch = column.slice(i, batch_size).to_pylist()
+        else:
+            batch = list(column[i:i + batch_size])
+        yield [None if is_missing(value) else value for value in batch]
+
+
+def get_texts(batch):
+    return [text for text in batch if text is not None]
+
+
+class ColumnBuilder(object):
+    def __init__(self, names):
+        self.names = names
+        self.columns = {name: [] for name in names}
+
+    def append(self, **values):
+        for name in self.names:
+            self.columns[name].append(values.get(name))
+
+    def build(self, output_format, index=None):
+        if output_format == OUTPUT_PANDAS:
+            try:
+                import pandas
+            except ImportError:
+                raise MonkeyLearnLocalException(
+                    "pandas output requires the 'pandas' package, install it with "
+                    "'pip install monkeylearn[pandas]'"
+                )
+            return pandas.DataFrame(self.columns, columns=list(self.names), index=index)
+        if output_format == OUTPUT_ARROW:
+            try:
+                import pyarrow
+            except ImportError:
+                raise MonkeyLearnLocalException(
+                    "arrow output requires the 'pyarrow' package, install it with "
+                    "'pip install monkeylearn[arrow]'"
+                )
+            return pyarrow.Table.from_pydict(self.columns)
+        return self.columns
+
+
+def add_classification_results(builder, batch, results):
+    # results only has the texts that were sent, missing ones get an error row
+    results = iter(results)
+    for text in batch:
+        if text is None:
+            builder.append(error=True)
+            continue
+        result = next(results)
+        classifications = result.get('classifications') or []
+        top = max(classifications, key=lambda c: c.get('confidence') or 0) \
+            if classifications else {}
+        builder.append(
+            tag_name=top.get('tag_name'),
+            tag_id=top.get('tag_id'),
+            confidence=top.get('confidence'),
+            error=result.get('error', False),
+        )
+
+
+def add_extraction_results(builder, batch, results, rows):
+    # results only has the texts that were sent, missing ones have no extractions
+    results = iter(results)
+    for row, text in zip(rows, batch):
+        if text is None:
+            continue
+        result = next(results)
+        for extraction in result.get('extractions') or []:
+            offset_span = extraction.get('offset_span') or (None, None)
+            builder.append(
+                row=row,
+                tag_name=extraction.get('tag_name'),
+                extracted_text=extraction.get('extracted_text'),
+                parsed_value=extraction.get('parsed_value'),
+                start=offset_span[0],
+                end=offset_span[1],
+            )
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+from array import array
+
+from six.moves import range
+
+
+ERROR_FLAG = 1
+HAS_ITEMS_FLAG = 2
+
+EMPTY_RECORDS = ()
+
+
+# Memory efficient replacement for the list of dicts returned by batched endpoints. Results are
+# stored in flat arrays and slot records with interned strings. Indexing or iterating builds
+# plain dicts on the fly, so code written for the regular body keeps working, but changes made
+# to those dicts are not stored back. This base class keeps the items of each document as they
+# are, subclasses store them in a more compact way.
+class CompactBody(object):
+    items_key = 'items'
+
+    def __init__(self, results=None):
+        self.items = []
+        self.texts = []
+        self.external_ids = []
+        self.flags = bytearray()
+        # Document keys other than text, external_id, error and the items key are rare
+        # (error_detail, for instance), they are stored sparsely by document index
+        self.extra = {}
+        self._strings = {}
+        if results is not None:
+            self.add_results(results)
+
+    def intern(self, value):
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+    def add_results(self, results):
+        for result in results:
+            index = len(self.texts)
+            result = dict(result)
+            self.texts.append(result.pop('text', None))
+            self.external_ids.append(self.intern(result.pop('external_id', None)))
+
+            flags = ERROR_FLAG if result.pop('error', False) else 0
+            if self.items_key in result:
+                flags |= HAS_ITEMS_FLAG
+                self.add_items(result.pop(self.items_key) or [])
+            else:
+                self.add_items([])
+            self.flags.append(flags)
+
+            if result:
+                self.extra[index] = result
+
+    def add_items(self, items):
+        self.items.append(tuple(items) if items else EMPTY_RECORDS)
+
+    def get_items(self, index):
+        return [dict(item) for item in self.items[index]]
+
+    def get_document(self, index):
+        document = {
+            'text': self.texts[index],
+            'external_id': self.external_ids[index],
+            'error': bool(self.flags[index] & ERROR_FLAG),
+        }
+        if self.flags[index] & HAS_ITEMS_FLAG:
+            document[self.items_key] = self.get_items(index)
+        document.update(self.extra.get(index, {}))
+        return document
+
+    def to_list(self):
+        return list(self)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.get_document(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('result index out of range')
+        return self.get_document(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.get_document(i)
+
+    def __eq__(self, other):
+        if isinstance(other, CompactBody):
+            other = other.to_list()
+        return self.to_list() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '<{} with {} results>'.format(self.__class__.__name__, len(self))
+
+
+class CompactClassificationBody(CompactBody):
+    items_key = 'classifications'
+
+    def __init__(self, results=None):
+        # The classifications of document i are in positions offsets[i]:offsets[i + 1]
+        self.offsets = array(str('l'), [0])
+        self.tag_ids = array(str('l'))
+        self.confidences = array(str('d'))
+        self.tag_names = []
+        # Other classification keys are stored sparsely by position, like document extra keys
+        self.item_extra = {}
+        super(CompactClassificationBody, self).__init__(results)
+
+    def add_items(self, items):
+        for item in items:
+            item = dict(item)
+            position = len(self.tag_ids)
+            self.tag_ids.append(item.pop('tag_id'))
+            self.confidences.append(item.pop('confidence'))
+            self.tag_names.append(self.intern(item.pop('tag_name')))
+            if item:
+                self.item_extra[position] = item
+        self.offsets.append(len(self.tag_ids))
+
+    def get_item(self, position):
+        item = {
+            'tag_name': self.tag_names[position],
+            'tag_id': self.tag_ids[position],
+            'confidence': self.confidences[position],
+        }
+        item.update(self.item_extra.get(position, {}))
+        return item
+
+    def get_items(self, index):
+        return [self.get_item(i) for i in range(self.offsets[index], self.offsets[index + 1])]
+
+
+class ExtractionRecord(object):
+    __slots__ = ('tag_name', 'extracted_text', 'parsed_value', 'offset_span', 'extra')
+
+    def __init__(self, tag_name, extracted_text, parsed_value, offset_span, extra=None):
+        self.tag_name = tag_name
+        self.extracted_text = extracted_text
+        self.parsed_value = parsed_value
+        self.offset_span = offset_span
+        self.extra = extra
+
+    def to_dict(self):
+        record = {
+            'tag_name': self.tag_name,
+            'extracted_text': self.extracted_text,
+            'parsed_value': self.parsed_value,
+        }
+        if self.offset_span is not None:
+            record['offset_span'] = list(self.offset_span)
+        if self.extra:
+            record.update(self.extra)
+        return record
+
+
+class CompactExtractionBody(CompactBody):
+    items_key = 'extractions'
+
+    def __init__(self, results=None):
+        self.extractions = []
+        super(CompactExtractionBody, self).__init__(results)
+
+    def add_items(self, items):
+        records = []
+        for item in items:
+            item = dict(item)
+            offset_span = item.pop('offset_span', None)
+            if offset_span is not None:
+                offset_span = tuple(offset_span)
+            records.append(ExtractionRecord(
+                tag_name=self.intern(item.pop('tag_name', None)),
+                extracted_text=item.pop('extracted_text', None),
+                parsed_value=item.pop('parsed_value', None),
+                offset_span=offset_span,
+                extra=item or None,
+            ))
+        self.extractions.append(tuple(records) if records else EMPTY_RECORDS)
+
+    def get_items(self, index):
+        return [record.to_dict() for record in self.extractions[index]]
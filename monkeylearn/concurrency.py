@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import os
+import threading
+
+
+# Makes sure only one thread resets an object after a fork
+fork_lock = threading.RLock()
+
+
+def reinit_fork_lock():
+    global fork_lock
+    fork_lock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reinit_fork_lock)
+
+
+class ForkSafe(object):
+    # Locks, connection pools and any other state that must not be shared with a parent process
+    # are created in reset(), which is called again the first time the object is used after a
+    # fork(). A lock held by another thread at fork time would never be released in the child.
+    def __init__(self):
+        self._pid = os.getpid()
+        self.reset()
+
+    def reset(self):
+        self.lock = threading.RLock()
+
+    def check_fork(self):
+        if self._pid != os.getpid():
+            with fork_lock:
+                if self._pid != os.getpid():
+                    self.reset()
+                    self._pid = os.getpid()
+
+    def get_or_create(self, name, factory, *args):
+        # Double-checked so the lock is only taken the first time
+        value = self.__dict__.get(name)
+        if value is None:
+            self.check_fork()
+            with self.lock:
+                value = self.__dict__.get(name)
+                if value is None:
+                    value = factory(*args)
+                    setattr(self, name, value)
+        return value
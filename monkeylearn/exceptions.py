@@ -14,6 +14,18 @@ class LocalParamValidationError(MonkeyLearnLocalException):
     pass
 
 
+class RequestTimeoutError(MonkeyLearnLocalException):
+    def __init__(self, message='Request timed out', response=None):
+        self.response = response
+        super(RequestTimeoutError, self).__init__(message)
+
+
+class QueryBudgetExceededError(MonkeyLearnLocalException):
+    def __init__(self, message='Not enough plan queries left', response=None):
+        self.response = response
+        super(QueryBudgetExceededError, self).__init__(message)
+
+
 class MonkeyLearnResponseException(MonkeyLearnException):
     def __init__(self, status_code=500, detail='Internal server error',
                  error_code=None, response=None):
@@ -4,9 +4,18 @@ from __future__ import print_function, unicode_literals, division, absolute_impo
 from six.moves import range
 
 from monkeylearn.base import ModelEndpointSet
+from monkeylearn.columnar import (
+    EXTRACTION_COLUMNS, ColumnBuilder, add_extraction_results, get_column_index,
+    get_texts, guess_output_format, iter_column_batches
+)
+from monkeylearn.compact import CompactExtractionBody
+from monkeylearn.exceptions import QueryBudgetExceededError, RequestTimeoutError
 from monkeylearn.settings import DEFAULT_BATCH_SIZE
 from monkeylearn.response import MonkeyLearnResponse
-from monkeylearn.validation import validate_batch_size, validate_order_by_param
+from monkeylearn.scheduler import PRIORITY_NORMAL
+from monkeylearn.validation import (
+    validate_batch_size, validate_order_by_param, validate_output_format, validate_priority
+)
 
 
 class Extraction(ModelEndpointSet):
@@ -30,23 +39,60 @@ class Extraction(ModelEndpointSet):
         return MonkeyLearnResponse(response)
 
     def extract(self, model_id, data, production_model=False, batch_size=DEFAULT_BATCH_SIZE,
-                retry_if_throttled=True, extra_args=None):
+                retry_if_throttled=True, extra_args=None, compact=False,
+                timeout=None, priority=PRIORITY_NORMAL):
         if extra_args is None:
             extra_args = {}
 
         validate_batch_size(batch_size)
+        validate_priority(priority)
 
         url = self.get_detail_url(model_id, action='extract')
 
-        response = MonkeyLearnResponse()
+        deadline = self.get_deadline(timeout)
+        response = MonkeyLearnResponse(
+            compact_body_class=CompactExtractionBody if compact else None
+        )
         for i in range(0, len(data), batch_size):
             data_dict = self.remove_none_value({
                 'data': data[i:i + batch_size],
                 'production_model': production_model,
             })
             data_dict.update(extra_args)
-            raw_response = self.make_request('POST', url, data_dict,
-                                             retry_if_throttled=retry_if_throttled)
+            try:
+                raw_response = self.make_batch_request(url, data_dict,
+                                                       retry_if_throttled=retry_if_throttled,
+                                                       deadline=deadline, priority=priority)
+            except (RequestTimeoutError, QueryBudgetExceededError) as e:
+                e.response = response
+                raise
             response.add_raw_response(raw_response)
 
         return response
+
+    def extract_column(self, model_id, column, production_model=False,
+                       batch_size=DEFAULT_BATCH_SIZE, retry_if_throttled=True, extra_args=None,
+                       output_format=None, priority=PRIORITY_NORMAL):
+        validate_batch_size(batch_size)
+        validate_priority(priority)
+        if output_format is None:
+            output_format = guess_output_format(column)
+        validate_output_format(output_format)
+
+        # Rows are the index labels of a pandas Series, and positions for anything else
+        index = get_column_index(column)
+        builder = ColumnBuilder(EXTRACTION_COLUMNS)
+        row_offset = 0
+        for batch in iter_column_batches(column, batch_size):
+            response = self.extract(model_id, get_texts(batch),
+                                    production_model=production_model, batch_size=batch_size,
+                                    retry_if_throttled=retry_if_throttled,
+                                    extra_args=extra_args, priority=priority)
+            if index is None:
+                rows = range(row_offset, row_offset + len(batch))
+            else:
+                rows = index[row_offset:row_offset + len(batch)].tolist()
+            add_extraction_results(builder, batch, response.body, rows)
+            row_offset += len(batch)
+
+        return builder.build(output_format)
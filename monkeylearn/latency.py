@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import collections
+import time
+
+from monkeylearn.concurrency import ForkSafe
+from monkeylearn.settings import (
+    DEFAULT_HEDGING_PERCENTILE, DEFAULT_HEDGING_BUDGET, DEFAULT_HEDGING_MIN_SAMPLES,
+    LATENCY_SAMPLES
+)
+
+
+now = getattr(time, 'monotonic', time.time)
+
+
+class LatencyTracker(ForkSafe):
+    def __init__(self, max_samples=LATENCY_SAMPLES):
+        self.samples = collections.deque(maxlen=max_samples)
+        super(LatencyTracker, self).__init__()
+
+    def add(self, latency):
+        self.check_fork()
+        with self.lock:
+            self.samples.append(latency)
+
+    def __len__(self):
+        return len(self.samples)
+
+    def percentile(self, percentile):
+        self.check_fork()
+        with self.lock:
+            samples = sorted(self.samples)
+        if not samples:
+            return None
+        index = int(round(percentile * (len(samples) - 1)))
+        return samples[index]
+
+    @property
+    def p50(self):
+        return self.percentile(0.5)
+
+    @property
+    def p99(self):
+        return self.percentile(0.99)
+
+
+class HedgingPolicy(ForkSafe):
+    # A duplicate of a batch request is sent when it takes longer than the given latency
+    # percentile of the previous batches (or a fixed delay, in seconds). At most budget * batches
+    # duplicates are sent, so hedging can't increase the query spend by more than that ratio.
+    def __init__(self, percentile=DEFAULT_HEDGING_PERCENTILE, budget=DEFAULT_HEDGING_BUDGET,
+                 min_samples=DEFAULT_HEDGING_MIN_SAMPLES, delay=None):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.delay = delay
+        self.batch_count = 0
+        self.hedge_count = 0
+        super(HedgingPolicy, self).__init__()
+
+    def get_delay(self, latency_tracker):
+        if self.delay is not None:
+            return self.delay
+        if len(latency_tracker) < self.min_samples:
+            return None
+        return latency_tracker.percentile(self.percentile)
+
+    def add_batch(self):
+        self.check_fork()
+        with self.lock:
+            self.batch_count += 1
+
+    def acquire_hedge(self):
+        self.check_fork()
+        with self.lock:
+            if self.hedge_count + 1 > self.budget * self.batch_count:
+                return False
+            self.hedge_count += 1
+            return True
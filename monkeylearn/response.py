@@ -9,7 +9,12 @@ from monkeylearn.exceptions import (
 
 
 class MonkeyLearnResponse(object):
-    def __init__(self, raw_responses=None):
+    def __init__(self, raw_responses=None, compact_body_class=None):
+        # The compact body is filled as responses are added, see add_raw_response
+        self.compact_body = None
+        if compact_body_class is not None:
+            self.compact_body = compact_body_class()
+
         if raw_responses is None:
             raw_responses = []
         elif isinstance(raw_responses, requests.Response):
@@ -49,7 +54,9 @@ class MonkeyLearnResponse(object):
 
     @property
     def body(self):
-        if not self._cached_body:
+        if self.compact_body is not None:
+            return self.compact_body
+        if self._cached_body is None:
             if self.request_count == 1:
                 body = self.raw_responses[0].json() if self.raw_responses[0].content else None
             else:
@@ -75,6 +82,12 @@ class MonkeyLearnResponse(object):
         if raw_response.status_code != requests.codes.ok:
             self.raise_for_status(raw_response)
 
+        if self.compact_body is not None and raw_response.content:
+            # Parse one batch at a time so the full dict body is never built, and drop the
+            # payload once it's parsed, only the headers of compact raw responses are kept
+            self.compact_body.add_results(raw_response.json())
+            raw_response._content = b''
+
     def raise_for_status(self, raw_response):
         try:
             body = raw_response.json()
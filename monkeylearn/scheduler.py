@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import heapq
+import itertools
+import threading
+
+from monkeylearn.concurrency import ForkSafe
+from monkeylearn.exceptions import QueryBudgetExceededError, RequestTimeoutError
+from monkeylearn.latency import now
+# The priorities are defined in settings so validation can use them, users import them from here
+from monkeylearn.settings import (  # noqa: F401
+    DEFAULT_MAX_CONCURRENCY, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+)
+from monkeylearn.validation import validate_priority, validate_scheduler_limits
+
+
+class RequestScheduler(ForkSafe):
+    # Shared by every endpoint set of a client. Requests wait in a queue ordered by priority (and
+    # arrival order), and only PRIORITY_HIGH requests can use the reserved concurrency slots and
+    # the reserved plan queries. Throttled requests don't keep their slot while they wait.
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY, reserved_concurrency=1,
+                 reserved_queries=0):
+        validate_scheduler_limits(max_concurrency, reserved_concurrency, reserved_queries)
+        self.max_concurrency = max_concurrency
+        self.reserved_concurrency = reserved_concurrency
+        self.reserved_queries = reserved_queries
+        self.queries_remaining = None
+        self.throttled_until = 0
+        super(RequestScheduler, self).__init__()
+
+    def reset(self):
+        super(RequestScheduler, self).reset()
+        self.condition = threading.Condition(self.lock)
+        self.waiting = []
+        self.counter = itertools.count()
+        self.active = 0
+        self.pending_queries = 0
+        # Tickets follow the order in which requests are sent
+        self.tickets = itertools.count()
+        self.queries_remaining_ticket = -1
+
+    def get_concurrency_limit(self, priority):
+        if priority == PRIORITY_HIGH:
+            return self.max_concurrency
+        return self.max_concurrency - self.reserved_concurrency
+
+    def check_query_budget(self, priority, cost):
+        if priority == PRIORITY_HIGH or not cost or self.queries_remaining is None:
+            return
+        available = self.queries_remaining - self.pending_queries - self.reserved_queries
+        if cost > available:
+            raise QueryBudgetExceededError(
+                'Not enough plan queries left for a priority {} request, {} queries are '
+                'reserved'.format(priority, self.reserved_queries)
+            )
+
+    def get_wait_time(self, entry, deadline):
+        priority = entry[0]
+        wait = None
+        if self.waiting[0] != entry or self.active >= self.get_concurrency_limit(priority):
+            # Woken up by release()
+            wait = float('inf')
+        elif priority != PRIORITY_HIGH and self.throttled_until > now():
+            # PRIORITY_HIGH requests aren't held back by other requests being throttled, but
+            # each of them still waits seconds_to_wait when it's throttled itself
+            wait = self.throttled_until - now()
+
+        if wait is not None and deadline is not None:
+            wait = min(wait, deadline - now())
+            if wait <= 0:
+                raise RequestTimeoutError()
+        return wait
+
+    def acquire(self, priority=PRIORITY_NORMAL, cost=0, deadline=None):
+        # Returns the ticket that must be passed to release()
+        validate_priority(priority)
+        self.check_fork()
+        with self.condition:
+            self.check_query_budget(priority, cost)
+            entry = (priority, next(self.counter))
+            heapq.heappush(self.waiting, entry)
+            try:
+                wait = self.get_wait_time(entry, deadline)
+                while wait is not None:
+                    self.condition.wait(None if wait == float('inf') else wait)
+                    self.check_query_budget(priority, cost)
+                    wait = self.get_wait_time(entry, deadline)
+            finally:
+                self.waiting.remove(entry)
+                heapq.heapify(self.waiting)
+                self.condition.notify_all()
+
+            self.active += 1
+            self.pending_queries += cost
+            return next(self.tickets)
+
+    def release(self, ticket, cost=0, response=None):
+        with self.condition:
+            self.active -= 1
+            self.pending_queries -= cost
+            if response is not None:
+                queries_remaining = response.headers.get('X-Query-Limit-Remaining')
+                # Concurrent responses can be released in any order, the header of a request
+                # that started before the last one applied is stale
+                if queries_remaining is not None and ticket > self.queries_remaining_ticket:
+                    self.queries_remaining = int(queries_remaining)
+                    self.queries_remaining_ticket = ticket
+            self.condition.notify_all()
+
+    def throttle(self, seconds):
+        with self.condition:
+            self.throttled_until = max(self.throttled_until, now() + seconds)
@@ -5,3 +5,18 @@ from __future__ import print_function, unicode_literals, division, absolute_impo
 DEFAULT_BATCH_SIZE = 200
 MAX_BATCH_SIZE = 500
 DEFAULT_BASE_URL = 'https://api.monkeylearn.com/'
+
+LATENCY_SAMPLES = 1000
+DEFAULT_HEDGING_PERCENTILE = 0.95
+DEFAULT_HEDGING_BUDGET = 0.05
+DEFAULT_HEDGING_MIN_SAMPLES = 20
+
+DEFAULT_MAX_CONCURRENCY = 5
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+OUTPUT_PANDAS = 'pandas'
+OUTPUT_ARROW = 'arrow'
+OUTPUT_DICT = 'dict'
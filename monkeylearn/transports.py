@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import json
+
+import six
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from monkeylearn.concurrency import ForkSafe
+from monkeylearn.exceptions import MonkeyLearnLocalException, RequestTimeoutError
+
+
+def build_response(status_code, content, headers=None, url=None):
+    # Every transport returns requests.Response objects, that's what MonkeyLearnResponse expects
+    response = requests.Response()
+    response.status_code = status_code
+    if isinstance(content, six.text_type):
+        content = content.encode('utf-8')
+    response._content = content or b''
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
+
+
+# Transports are shared by every thread using a client. Subclasses create their connection pools
+# in reset() so a forked child process gets its own connections instead of the parent's ones.
+class Transport(ForkSafe):
+    def request(self, method, url, data=None, params=None, headers=None, timeout=None):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    def __init__(self, session=None):
+        # Sessions passed by the caller are used as they are, even after a fork
+        self.owns_session = session is None
+        self.session = session
+        super(RequestsTransport, self).__init__()
+
+    def reset(self):
+        super(RequestsTransport, self).reset()
+        if self.owns_session:
+            # The session inherited from the parent process isn't closed, its connection pool
+            # locks may have been held by another thread at fork time, it's just replaced
+            self.session = requests.Session()
+
+    def request(self, method, url, data=None, params=None, headers=None, timeout=None):
+        self.check_fork()
+        try:
+            return self.session.request(method, url, data=data, params=params, headers=headers,
+                                        timeout=timeout)
+        except requests.Timeout:
+            raise RequestTimeoutError()
+
+    def close(self):
+        self.session.close()
+
+
+class HTTP2Transport(Transport):
+    # Concurrent requests made through the same transport are multiplexed over one connection
+    def __init__(self, client=None, **client_kwargs):
+        # httpx is optional and slow to import, it's only imported when the transport is used
+        try:
+            import httpx
+        except ImportError:
+            httpx = None
+        if client is None and httpx is None:
+            raise MonkeyLearnLocalException(
+                "HTTP2Transport requires the 'httpx' package with HTTP/2 support, install it "
+                "with 'pip install monkeylearn[http2]'"
+            )
+        self.client_class = httpx.Client if httpx is not None else None
+        # An empty tuple catches nothing, a client passed by the caller raises its own errors
+        self.timeout_error = httpx.TimeoutException if httpx is not None else ()
+        # Clients passed by the caller are used as they are, even after a fork
+        self.owns_client = client is None
+        self.client = client
+        self.client_kwargs = client_kwargs
+        super(HTTP2Transport, self).__init__()
+
+    def reset(self):
+        super(HTTP2Transport, self).reset()
+        if self.owns_client:
+            # The client inherited from the parent process isn't closed, that would send a GOAWAY
+            # frame through the parent's connection, it's just replaced
+            self.client = self.client_class(http2=True, **self.client_kwargs)
+
+    def request(self, method, url, data=None, params=None, headers=None, timeout=None):
+        kwargs = {}
+        if timeout is not None:
+            # httpx takes timeout=None as no timeout at all instead of the client default
+            kwargs['timeout'] = timeout
+        self.check_fork()
+        try:
+            response = self.client.request(method, url, content=data, params=params,
+                                           headers=headers, **kwargs)
+        except self.timeout_error:
+            raise RequestTimeoutError()
+        return build_response(response.status_code, response.content,
+                              headers=response.headers, url=str(response.url))
+
+    def close(self):
+        self.client.close()
+
+
+class InMemoryTransport(Transport):
+    # handler(method, url, data, params, headers) must return a (status_code, body, headers)
+    # tuple, body is serialized as JSON unless it is None. With record=True the requests are kept
+    # in self.requests, leave it off for load tests.
+    def __init__(self, handler, record=False):
+        self.handler = handler
+        self.requests = [] if record else None
+        super(InMemoryTransport, self).__init__()
+
+    def request(self, method, url, data=None, params=None, headers=None, timeout=None):
+        if self.requests is not None:
+            self.requests.append((method, url, data, params, headers))
+        status_code, body, response_headers = self.handler(method, url, data, params, headers)
+        content = json.dumps(body) if body is not None else b''
+        return build_response(status_code, content, headers=response_headers, url=url)
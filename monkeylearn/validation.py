@@ -4,11 +4,16 @@ from __future__ import print_function, unicode_literals, division, absolute_impo
 import six
 import re
 
-from monkeylearn.settings import MAX_BATCH_SIZE
+from monkeylearn.settings import (
+    MAX_BATCH_SIZE, OUTPUT_ARROW, OUTPUT_DICT, OUTPUT_PANDAS, PRIORITY_HIGH, PRIORITY_LOW,
+    PRIORITY_NORMAL
+)
 from monkeylearn.exceptions import LocalParamValidationError
 
 
 ORDER_BY_FIELD_RE = re.compile(r'^-?[a-z_]+$')
+OUTPUT_FORMATS = (OUTPUT_PANDAS, OUTPUT_ARROW, OUTPUT_DICT)
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
 
 
 def validate_batch_size(batch_size):
@@ -66,3 +71,27 @@ def validate_order_by_param(order_by_param):
             order_by.append(order_by_field)
 
     return ','.join(order_by)
+
+
+def validate_output_format(output_format):
+    if output_format not in OUTPUT_FORMATS:
+        raise LocalParamValidationError(
+            "'output_format' parameter must be one of: {0}".format(', '.join(OUTPUT_FORMATS))
+        )
+
+
+def validate_priority(priority):
+    if priority not in PRIORITIES:
+        raise LocalParamValidationError(
+            "'priority' parameter must be one of PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW"
+        )
+
+
+def validate_scheduler_limits(max_concurrency, reserved_concurrency, reserved_queries):
+    if not 0 <= reserved_concurrency < max_concurrency:
+        # Otherwise requests other than PRIORITY_HIGH ones would never get a slot
+        raise LocalParamValidationError(
+            "'reserved_concurrency' must be at least 0 and less than 'max_concurrency'"
+        )
+    if reserved_queries < 0:
+        raise LocalParamValidationError("'reserved_queries' must be at least 0")
@@ -12,21 +12,16 @@ class Workflows(ModelEndpointSet):
 
     @property
     def steps(self):
-        if not hasattr(self, '_steps'):
-            self._steps = WorkflowSteps(self.token, self.base_url)
-        return self._steps
+        return self.get_or_create('_steps', self.get_nested_endpoint_set, WorkflowSteps)
 
     @property
     def data(self):
-        if not hasattr(self, '_data'):
-            self._data = WorkflowData(self.token, self.base_url)
-        return self._data
+        return self.get_or_create('_data', self.get_nested_endpoint_set, WorkflowData)
 
     @property
     def custom_fields(self):
-        if not hasattr(self, '_custom_fields'):
-            self._custom_fields = WorkflowCustomFields(self.token, self.base_url)
-        return self._custom_fields
+        return self.get_or_create('_custom_fields', self.get_nested_endpoint_set,
+                                  WorkflowCustomFields)
 
     def create(self, name, db_name, steps, description='', webhook_url=None, custom_fields=None,
                sources=None, retry_if_throttled=True):
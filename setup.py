@@ -32,4 +32,9 @@ setup(
         'requests>=2.8.1',
         'six>=1.10.0',
     ],
+    extras_require={
+        'pandas': ['pandas>=0.20'],
+        'arrow': ['pyarrow>=0.15'],
+        'http2': ['httpx[http2]>=0.18'],
+    },
 )
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import threading
+
+import pytest
+
+from monkeylearn import MonkeyLearn
+from monkeylearn.transports import InMemoryTransport
+
+from helpers import APIRequestHandler, ThreadingHTTPServer, api_handler
+
+
+@pytest.fixture
+def transport():
+    return InMemoryTransport(api_handler, record=True)
+
+
+@pytest.fixture
+def ml(transport):
+    return MonkeyLearn('token', transport=transport)
+
+
+@pytest.fixture
+def api_server():
+    # Local stand-in for the MonkeyLearn API, returns its base URL
+    server = ThreadingHTTPServer(('127.0.0.1', 0), APIRequestHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield 'http://127.0.0.1:{}/'.format(server.server_port)
+    server.shutdown()
+    server.server_close()
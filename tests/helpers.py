@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+# Shared by conftest.py fixtures and test modules, conftest.py only defines fixtures
+import json
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+
+def get_text(data_item):
+    if isinstance(data_item, dict):
+        return data_item['text']
+    return data_item
+
+
+def classify_result(text):
+    return {
+        'text': text,
+        'external_id': None,
+        'error': False,
+        'classifications': [
+            {'tag_name': 'Short', 'tag_id': 1, 'confidence': 0.5},
+            {'tag_name': 'Long', 'tag_id': 2, 'confidence': min(len(text) / 10.0, 1.0)},
+        ],
+    }
+
+
+def extract_result(text):
+    return {
+        'text': text,
+        'external_id': None,
+        'error': False,
+        'extractions': [
+            {
+                'tag_name': 'Word',
+                'extracted_text': word,
+                'parsed_value': word.upper(),
+                'offset_span': [text.index(word), text.index(word) + len(word)],
+            }
+            for word in text.split()
+        ],
+    }
+
+
+def api_handler(method, url, data, params, headers):
+    texts = [get_text(item) for item in json.loads(data)['data']]
+    if '/classify/' in url:
+        body = [classify_result(text) for text in texts]
+    else:
+        body = [extract_result(text) for text in texts]
+    return 200, body, {
+        'X-Query-Limit-Limit': '10000',
+        'X-Query-Limit-Remaining': '5000',
+        'X-Query-Limit-Request-Queries': str(len(texts)),
+    }
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    # Forked workers open many connections at once, the default backlog of 5 resets some
+    request_queue_size = 128
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8')
+        status_code, body, headers = api_handler('POST', self.path, data, None, self.headers)
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from monkeylearn.columnar import CLASSIFICATION_COLUMNS, EXTRACTION_COLUMNS
+
+TEXTS = ['a', 'bbbbbbb', 'cc dd', 'eeeeeeeeeeee']
+
+
+def test_classify_column_dict(ml, transport):
+    result = ml.classifiers.classify_column('cl_test', TEXTS, batch_size=3)
+
+    assert list(result) == list(CLASSIFICATION_COLUMNS)
+    assert result['tag_name'] == ['Short', 'Long', 'Short', 'Long']
+    assert result['tag_id'] == [1, 2, 1, 2]
+    assert result['confidence'] == [0.5, 0.7, 0.5, 1.0]
+    assert result['error'] == [False] * 4
+    assert len(transport.requests) == 2
+
+
+def test_classify_column_pandas_keeps_index(ml):
+    pandas = pytest.importorskip('pandas')
+    column = pandas.Series(TEXTS, index=[40, 30, 20, 10])
+
+    result = ml.classifiers.classify_column('cl_test', column, batch_size=2)
+
+    assert isinstance(result, pandas.DataFrame)
+    assert list(result.index) == [40, 30, 20, 10]
+    assert list(result['tag_name']) == ['Short', 'Long', 'Short', 'Long']
+    assert result.loc[20, 'confidence'] == 0.5
+
+
+def test_classify_column_pandas_string_index(ml):
+    pandas = pytest.importorskip('pandas')
+    column = pandas.Series(TEXTS, index=['w', 'x', 'y', 'z'])
+
+    result = ml.classifiers.classify_column('cl_test', column, batch_size=3)
+
+    assert list(result.index) == ['w', 'x', 'y', 'z']
+    assert list(result['tag_id']) == [1, 2, 1, 2]
+
+
+def test_classify_column_arrow_chunked_array(ml):
+    pyarrow = pytest.importorskip('pyarrow')
+    column = pyarrow.chunked_array([TEXTS[:1], TEXTS[1:]])
+
+    result = ml.classifiers.classify_column('cl_test', column, batch_size=2)
+
+    assert isinstance(result, pyarrow.Table)
+    assert result.column_names == list(CLASSIFICATION_COLUMNS)
+    assert result.column('tag_name').to_pylist() == ['Short', 'Long', 'Short', 'Long']
+    assert result.column('confidence').type == pyarrow.float64()
+
+
+def test_classify_column_list_to_pandas(ml):
+    pandas = pytest.importorskip('pandas')
+
+    result = ml.classifiers.classify_column('cl_test', TEXTS, output_format='pandas')
+
+    assert isinstance(result, pandas.DataFrame)
+    assert list(result.index) == [0, 1, 2, 3]
+    assert list(result['tag_name']) == ['Short', 'Long', 'Short', 'Long']
+
+
+def test_classify_column_arrow_to_pandas(ml):
+    pandas = pytest.importorskip('pandas')
+    pyarrow = pytest.importorskip('pyarrow')
+
+    for column in (pyarrow.array(TEXTS), pyarrow.chunked_array([TEXTS[:2], TEXTS[2:]])):
+        result = ml.classifiers.classify_column('cl_test', column, output_format='pandas')
+
+        assert isinstance(result, pandas.DataFrame)
+        assert list(result.index) == [0, 1, 2, 3]
+
+
+def test_classify_column_pandas_missing_values(ml, transport):
+    pandas = pytest.importorskip('pandas')
+    column = pandas.Series(['a', float('nan'), None, 'bbbbbbb'], index=[40, 30, 20, 10])
+
+    result = ml.classifiers.classify_column('cl_test', column)
+
+    assert list(result.index) == [40, 30, 20, 10]
+    assert list(result['error']) == [False, True, True, False]
+    assert result.loc[10, 'tag_name'] == 'Long'
+    assert result['tag_name'].isna().tolist() == [False, True, True, False]
+    assert [json.loads(data)['data'] for _, _, data, _, _ in transport.requests] == [
+        ['a', 'bbbbbbb']]
+
+
+def test_classify_column_arrow_nulls(ml, transport):
+    pyarrow = pytest.importorskip('pyarrow')
+    column = pyarrow.chunked_array([[None, 'a'], [None, None]])
+
+    result = ml.classifiers.classify_column('cl_test', column, batch_size=2)
+
+    assert result.column('error').to_pylist() == [True, False, True, True]
+    assert result.column('tag_name').to_pylist() == [None, 'Short', None, None]
+    assert len(transport.requests) == 1
+
+
+def test_classify_column_empty(ml, transport):
+    result = ml.classifiers.classify_column('cl_test', [])
+
+    assert result == {name: [] for name in CLASSIFICATION_COLUMNS}
+    assert transport.requests == []
+
+
+def test_classify_column_output_format(ml):
+    pandas = pytest.importorskip('pandas')
+
+    result = ml.classifiers.classify_column('cl_test', pandas.Series(TEXTS),
+                                            output_format='dict')
+
+    assert result['tag_id'] == [1, 2, 1, 2]
+
+
+def test_extract_column_dict(ml):
+    result = ml.extractors.extract_column('ex_test', TEXTS, batch_size=3)
+
+    assert list(result) == list(EXTRACTION_COLUMNS)
+    assert result['row'] == [0, 1, 2, 2, 3]
+    assert result['extracted_text'] == ['a', 'bbbbbbb', 'cc', 'dd', 'eeeeeeeeeeee']
+    assert result['parsed_value'][2] == 'CC'
+    assert result['start'] == [0, 0, 0, 3, 0]
+    assert result['end'] == [1, 7, 2, 5, 12]
+
+
+def test_extract_column_pandas(ml):
+    pandas = pytest.importorskip('pandas')
+    column = pandas.Series(TEXTS, index=[40, 30, 20, 10])
+
+    result = ml.extractors.extract_column('ex_test', column, batch_size=2)
+
+    assert isinstance(result, pandas.DataFrame)
+    assert list(result['row']) == [40, 30, 20, 20, 10]
+
+
+def test_extract_column_pandas_string_index(ml):
+    pandas = pytest.importorskip('pandas')
+    column = pandas.Series(TEXTS, index=['w', 'x', 'y', 'z'])
+
+    result = ml.extractors.extract_column('ex_test', column, batch_size=3, output_format='dict')
+
+    assert result['row'] == ['w', 'x', 'y', 'y', 'z']
+
+
+def test_extract_column_missing_values(ml, transport):
+    pandas = pytest.importorskip('pandas')
+    column = pandas.Series([None, 'cc dd', float('nan'), 'a'], index=['w', 'x', 'y', 'z'])
+
+    result = ml.extractors.extract_column('ex_test', column, output_format='dict')
+
+    assert result['row'] == ['x', 'x', 'z']
+    assert result['extracted_text'] == ['cc', 'dd', 'a']
+    assert json.loads(transport.requests[0][2])['data'] == ['cc dd', 'a']
+
+
+def test_extract_column_arrow_nulls(ml, transport):
+    pyarrow = pytest.importorskip('pyarrow')
+
+    result = ml.extractors.extract_column('ex_test', pyarrow.array([None, 'a', None]))
+
+    assert result.column('row').to_pylist() == [1]
+    assert json.loads(transport.requests[0][2])['data'] == ['a']
+
+
+def test_extract_column_arrow_chunked_array(ml):
+    pyarrow = pytest.importorskip('pyarrow')
+    column = pyarrow.chunked_array([TEXTS[:3], TEXTS[3:]])
+
+    result = ml.extractors.extract_column('ex_test', column, batch_size=2)
+
+    assert result.column('tag_name').to_pylist() == ['Word'] * 5
+    assert result.column('row').to_pylist() == [0, 1, 2, 2, 3]
+
+
+def test_extract_column_empty(ml):
+    pandas = pytest.importorskip('pandas')
+
+    result = ml.extractors.extract_column('ex_test', pandas.Series([], dtype=object))
+
+    assert isinstance(result, pandas.DataFrame)
+    assert len(result) == 0
+    assert list(result.columns) == list(EXTRACTION_COLUMNS)
+
+
+def test_optional_packages_are_not_imported():
+    code = "import sys, monkeylearn; print('pandas' in sys.modules, 'pyarrow' in sys.modules)"
+    output = subprocess.check_output([sys.executable, '-c', code])
+
+    assert output.split() == [b'False', b'False']
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+from array import array
+
+import pytest
+
+from monkeylearn.compact import CompactBody, CompactClassificationBody, CompactExtractionBody
+
+from helpers import classify_result, extract_result
+
+TEXTS = ['a', 'bbbbbbb', 'cc dd']
+
+
+@pytest.fixture
+def classification_results():
+    results = [classify_result(text) for text in TEXTS]
+    results.append({'text': 'x', 'external_id': 'ext', 'error': True, 'error_detail': 'Bad'})
+    results[1]['classifications'][0]['confidence_level'] = 'high'
+    return results
+
+
+@pytest.fixture
+def extraction_results():
+    results = [extract_result(text) for text in TEXTS]
+    results[2]['extractions'][0]['score'] = 0.9
+    results[0]['language'] = 'en'
+    return results
+
+
+def test_classification_body_indexing(classification_results):
+    body = CompactClassificationBody(classification_results)
+
+    assert len(body) == 4
+    assert body[0] == classification_results[0]
+    assert body[-1] == classification_results[-1]
+    assert body[-4] == classification_results[0]
+    assert body[1:3] == classification_results[1:3]
+    assert body[::-2] == classification_results[::-2]
+    assert list(body) == classification_results
+    with pytest.raises(IndexError):
+        body[4]
+    with pytest.raises(IndexError):
+        body[-5]
+
+
+def test_classification_body_storage(classification_results):
+    body = CompactClassificationBody(classification_results)
+
+    assert body.tag_ids == array(str('l'), [1, 2, 1, 2, 1, 2])
+    assert body.offsets == array(str('l'), [0, 2, 4, 6, 6])
+    assert body.confidences[1] == 0.1
+    # Tag names are stored once
+    assert body.tag_names[0] is body.tag_names[2]
+
+
+def test_classification_body_extra_keys(classification_results):
+    body = CompactClassificationBody(classification_results)
+
+    assert body[1]['classifications'][0]['confidence_level'] == 'high'
+    assert 'confidence_level' not in body[0]['classifications'][0]
+    assert body[3]['error_detail'] == 'Bad'
+    assert 'classifications' not in body[3]
+
+
+def test_extraction_body(extraction_results):
+    body = CompactExtractionBody(extraction_results)
+
+    assert len(body) == 3
+    assert body.to_list() == extraction_results
+    assert body[-1]['extractions'][1]['offset_span'] == [3, 5]
+    assert body[2]['extractions'][0]['score'] == 0.9
+    assert body[0]['language'] == 'en'
+    assert body[1:] == extraction_results[1:]
+
+
+def test_body_equality(classification_results, extraction_results):
+    body = CompactClassificationBody(classification_results)
+
+    assert body == classification_results
+    assert body == CompactClassificationBody(classification_results)
+    assert body != classification_results[:2]
+    assert body != CompactExtractionBody(extraction_results)
+    assert CompactClassificationBody() == []
+
+
+def test_generic_body():
+    results = [{'text': 'a', 'external_id': None, 'error': False, 'items': [{'key': 1}]}]
+    body = CompactBody(results)
+
+    assert body == results
+    body[0]['items'][0]['key'] = 2
+    assert body[0]['items'][0]['key'] == 1
+
+
+def test_classify_compact_response(ml):
+    texts = ['text {}'.format(i) for i in range(7)]
+
+    response = ml.classifiers.classify('cl_test', texts, batch_size=3, compact=True)
+
+    assert isinstance(response.body, CompactClassificationBody)
+    assert response.body is response.body
+    assert response.body == ml.classifiers.classify('cl_test', texts, batch_size=3).body
+    assert response.request_count == 3
+    assert response.request_queries_used == 7
+    # The payloads are dropped once parsed
+    assert all(rr.content == b'' for rr in response.raw_responses)
+
+
+def test_empty_compact_response_is_cached(ml):
+    response = ml.extractors.extract('ex_test', [], compact=True)
+
+    assert response.body == []
+    assert response.body is response.body
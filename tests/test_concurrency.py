@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import os
+import threading
+
+import pytest
+import requests
+
+from monkeylearn import MonkeyLearn
+from monkeylearn.transports import RequestsTransport
+
+THREADS = 16
+CALLS_PER_THREAD = 5
+WORKERS = 4
+TEXTS = ['text {}'.format(i) for i in range(5)]
+
+
+def classify_many(ml, calls, results):
+    for _ in range(calls):
+        response = ml.classifiers.classify('cl_test', TEXTS, batch_size=2)
+        results.append([result['text'] for result in response.body])
+
+
+def run_threads(ml, threads, calls):
+    results = []
+    workers = [threading.Thread(target=classify_many, args=(ml, calls, results))
+               for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def test_shared_client_threads(api_server):
+    ml = MonkeyLearn('token', base_url=api_server)
+
+    endpoint_sets = []
+    getters = [threading.Thread(target=lambda: endpoint_sets.append(ml.classifiers.tags))
+               for _ in range(THREADS)]
+    for getter in getters:
+        getter.start()
+    for getter in getters:
+        getter.join()
+    assert len(set(id(endpoint_set) for endpoint_set in endpoint_sets)) == 1
+
+    results = run_threads(ml, THREADS, CALLS_PER_THREAD)
+
+    assert results == [TEXTS] * THREADS * CALLS_PER_THREAD
+    assert len(ml.batch_latency) == THREADS * CALLS_PER_THREAD * 3
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='fork() is not available')
+def test_shared_client_forked_workers(api_server):
+    ml = MonkeyLearn('token', base_url=api_server)
+    parent_session = ml.transport.session
+
+    # Fork while other threads are using the client
+    busy = [threading.Thread(target=classify_many, args=(ml, CALLS_PER_THREAD, []))
+            for _ in range(THREADS // 2)]
+    for thread in busy:
+        thread.start()
+
+    pids = []
+    for _ in range(WORKERS):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                results = run_threads(ml, THREADS // 4, CALLS_PER_THREAD)
+                new_session = ml.transport.session is not parent_session
+                if new_session and results == [TEXTS] * (THREADS // 4) * CALLS_PER_THREAD:
+                    exit_code = 0
+            finally:
+                os._exit(exit_code)
+        pids.append(pid)
+
+    exit_codes = [os.waitpid(pid, 0)[1] for pid in pids]
+    for thread in busy:
+        thread.join()
+
+    assert exit_codes == [0] * WORKERS
+    assert ml.transport.session is parent_session
+    assert run_threads(ml, 2, 1) == [TEXTS] * 2
+
+
+def test_caller_session_is_kept_after_fork():
+    session = requests.Session()
+    transport = RequestsTransport(session=session)
+
+    transport._pid = -1
+    transport.check_fork()
+
+    assert transport.session is session
+    assert transport._pid == os.getpid()
+
+
+def test_owned_session_is_replaced_after_fork():
+    transport = RequestsTransport()
+    session = transport.session
+
+    transport._pid = -1
+    transport.check_fork()
+
+    assert transport.session is not session
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import time
+
+import pytest
+
+from monkeylearn import MonkeyLearn
+from monkeylearn.exceptions import RequestTimeoutError
+from monkeylearn.latency import HedgingPolicy, LatencyTracker
+from monkeylearn.transports import InMemoryTransport
+
+from helpers import api_handler
+
+
+def test_latency_tracker_percentiles():
+    tracker = LatencyTracker(max_samples=100)
+    assert tracker.p50 is None
+
+    for i in range(200):
+        tracker.add(i)
+
+    assert len(tracker) == 100
+    assert tracker.p50 == 150
+    assert tracker.p99 == 198
+    assert tracker.percentile(0) == 100
+
+
+def test_timeout_is_a_hard_cap():
+    def slow_handler(*args):
+        time.sleep(1)
+        return api_handler(*args)
+
+    ml = MonkeyLearn('token', transport=InMemoryTransport(slow_handler))
+    start = time.time()
+    with pytest.raises(RequestTimeoutError) as exc_info:
+        ml.classifiers.classify('cl_test', ['a', 'b'], batch_size=1, timeout=0.2)
+
+    assert time.time() - start < 0.5
+    assert exc_info.value.response.request_count == 0
+
+
+def test_timeout_keeps_successful_batches(ml):
+    response = ml.classifiers.classify('cl_test', ['a', 'b', 'c'], batch_size=1, timeout=10)
+
+    assert len(response.body) == 3
+
+
+def test_throttling_wait_is_not_measured():
+    calls = []
+
+    def throttling_handler(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            return 429, {'error_code': 'CONCURRENCY_RATE_LIMIT', 'seconds_to_wait': 1}, {}
+        return api_handler(*args)
+
+    ml = MonkeyLearn('token', transport=InMemoryTransport(throttling_handler))
+    ml.classifiers.classify('cl_test', ['a'])
+
+    assert len(calls) == 2
+    assert len(ml.batch_latency) == 2
+    assert ml.batch_latency.p99 < 0.5
+
+
+def test_hedged_request_returns_first_answer():
+    calls = []
+
+    def handler(*args):
+        calls.append(args)
+        if len(calls) == 21:
+            time.sleep(2)
+        return api_handler(*args)
+
+    transport = InMemoryTransport(handler, record=True)
+    ml = MonkeyLearn('token', transport=transport,
+                     hedging=HedgingPolicy(percentile=0.9, budget=0.5, min_samples=20))
+    ml.classifiers.classify('cl_test', ['a'] * 20, batch_size=1)
+
+    start = time.time()
+    response = ml.classifiers.classify('cl_test', ['slow'], batch_size=1)
+
+    assert time.time() - start < 1
+    assert response.body[0]['text'] == 'slow'
+    assert len(calls) == 22
+    assert ml.hedging.hedge_count == 1
+
+
+def test_hedging_budget():
+    policy = HedgingPolicy(budget=0.1)
+    for _ in range(10):
+        policy.add_batch()
+
+    assert policy.acquire_hedge()
+    assert not policy.acquire_hedge()
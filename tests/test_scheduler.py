@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import threading
+import time
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from monkeylearn import MonkeyLearn
+from monkeylearn.exceptions import (
+    LocalParamValidationError, QueryBudgetExceededError, RequestTimeoutError
+)
+from monkeylearn.latency import now
+from monkeylearn.scheduler import RequestScheduler, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+from monkeylearn.transports import InMemoryTransport
+
+from helpers import api_handler
+
+
+class FakeResponse(object):
+    def __init__(self, queries_remaining):
+        self.headers = CaseInsensitiveDict({'X-Query-Limit-Remaining': str(queries_remaining)})
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'max_concurrency': 1},
+    {'max_concurrency': 2, 'reserved_concurrency': 2},
+    {'max_concurrency': 2, 'reserved_concurrency': -1},
+    {'reserved_queries': -1},
+])
+def test_invalid_limits(kwargs):
+    with pytest.raises(LocalParamValidationError):
+        RequestScheduler(**kwargs)
+
+
+def test_no_reserved_concurrency():
+    scheduler = RequestScheduler(max_concurrency=1, reserved_concurrency=0)
+    ticket = scheduler.acquire(priority=PRIORITY_NORMAL, deadline=now() + 1)
+    scheduler.release(ticket)
+
+
+def test_invalid_priority(ml):
+    with pytest.raises(LocalParamValidationError):
+        ml.classifiers.classify('cl_test', ['a'], priority=5)
+    with pytest.raises(LocalParamValidationError):
+        RequestScheduler().acquire(priority=-1)
+
+
+def test_stale_queries_remaining_is_ignored():
+    scheduler = RequestScheduler(max_concurrency=3)
+    first = scheduler.acquire()
+    second = scheduler.acquire()
+
+    scheduler.release(second, response=FakeResponse(100))
+    scheduler.release(first, response=FakeResponse(500))
+
+    assert scheduler.queries_remaining == 100
+
+
+def test_reserved_queries():
+    queries_remaining = [13]
+
+    def handler(*args):
+        status_code, body, headers = api_handler(*args)
+        queries_remaining[0] -= len(body)
+        headers['X-Query-Limit-Remaining'] = str(queries_remaining[0])
+        return status_code, body, headers
+
+    scheduler = RequestScheduler(reserved_queries=10)
+    ml = MonkeyLearn('token', transport=InMemoryTransport(handler), scheduler=scheduler)
+    ml.classifiers.classify('cl_test', ['a'])
+
+    with pytest.raises(QueryBudgetExceededError) as exc_info:
+        ml.classifiers.classify('cl_test', ['a', 'b', 'c', 'd'], batch_size=2,
+                                priority=PRIORITY_LOW)
+    assert len(exc_info.value.response.body) == 2
+
+    ml.classifiers.classify('cl_test', ['a', 'b', 'c'], priority=PRIORITY_HIGH)
+
+
+def start_waiting(scheduler, target, *args):
+    # Returns once the thread is waiting in the scheduler queue
+    waiting = len(scheduler.waiting)
+    thread = threading.Thread(target=target, args=args)
+    thread.start()
+    while len(scheduler.waiting) == waiting:
+        time.sleep(0.001)
+    return thread
+
+
+def test_high_priority_is_served_first():
+    scheduler = RequestScheduler(max_concurrency=1, reserved_concurrency=0)
+    served = []
+
+    def request(priority):
+        ticket = scheduler.acquire(priority=priority)
+        served.append(priority)
+        scheduler.release(ticket)
+
+    ticket = scheduler.acquire()
+    threads = [start_waiting(scheduler, request, priority)
+               for priority in (PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH)]
+    scheduler.release(ticket)
+    for thread in threads:
+        thread.join()
+
+    assert served == [PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW]
+
+
+def test_reserved_concurrency():
+    scheduler = RequestScheduler(max_concurrency=2, reserved_concurrency=1)
+    ticket = scheduler.acquire(priority=PRIORITY_LOW)
+
+    for priority in (PRIORITY_NORMAL, PRIORITY_LOW):
+        with pytest.raises(RequestTimeoutError):
+            scheduler.acquire(priority=priority, deadline=now() + 0.1)
+    high_ticket = scheduler.acquire(priority=PRIORITY_HIGH, deadline=now() + 0.1)
+
+    served = []
+
+    def request():
+        served.append(scheduler.acquire())
+
+    thread = start_waiting(scheduler, request)
+    scheduler.release(high_ticket)
+    time.sleep(0.05)
+    assert served == []
+
+    scheduler.release(ticket)
+    thread.join()
+    assert len(served) == 1
+
+
+def test_throttling_only_blocks_lower_priorities():
+    scheduler = RequestScheduler()
+    scheduler.throttle(30)
+
+    for priority in (PRIORITY_NORMAL, PRIORITY_LOW):
+        with pytest.raises(RequestTimeoutError):
+            scheduler.acquire(priority=priority, deadline=now() + 0.1)
+    ticket = scheduler.acquire(priority=PRIORITY_HIGH, deadline=now() + 0.1)
+    scheduler.release(ticket)
+
+
+def test_throttled_high_priority_request_waits_seconds_to_wait():
+    throttled_until = now() + 1.5
+    calls = []
+
+    def throttling_handler(*args):
+        calls.append(now())
+        if now() < throttled_until:
+            return 429, {'error_code': 'CONCURRENCY_RATE_LIMIT', 'seconds_to_wait': 2}, {}
+        return api_handler(*args)
+
+    ml = MonkeyLearn('token', transport=InMemoryTransport(throttling_handler),
+                     scheduler=RequestScheduler())
+    response = ml.classifiers.classify('cl_test', ['a'], priority=PRIORITY_HIGH)
+
+    assert len(response.body) == 1
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 2
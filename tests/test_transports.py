@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, unicode_literals, division, absolute_import
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from monkeylearn import MonkeyLearn
+from monkeylearn.exceptions import MonkeyLearnLocalException
+from monkeylearn.transports import HTTP2Transport, build_response
+
+from helpers import api_handler
+
+
+class FakeClient(object):
+    def request(self, method, url, content=None, params=None, headers=None, **kwargs):
+        status_code, body, response_headers = api_handler(method, url, content, params, headers)
+        return build_response(status_code, json.dumps(body), headers=response_headers, url=url)
+
+
+def test_httpx_is_not_imported():
+    code = "import sys, monkeylearn; print('httpx' in sys.modules)"
+    output = subprocess.check_output([sys.executable, '-c', code])
+
+    assert output.strip() == b'False'
+
+
+def test_http2_transport_without_httpx(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'httpx', None)
+
+    with pytest.raises(MonkeyLearnLocalException):
+        HTTP2Transport()
+
+    ml = MonkeyLearn('token', transport=HTTP2Transport(client=FakeClient()))
+    response = ml.classifiers.classify('cl_test', ['a', 'b'])
+
+    assert len(response.body) == 2
+
+
+def test_http2_transport_with_httpx():
+    httpx = pytest.importorskip('httpx')
+
+    def handler(request):
+        status_code, body, headers = api_handler(request.method, str(request.url),
+                                                 request.content, None, request.headers)
+        return httpx.Response(status_code, json=body, headers=headers)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    ml = MonkeyLearn('token', transport=HTTP2Transport(client=client))
+    response = ml.classifiers.classify('cl_test', ['a', 'b'], timeout=10)
+
+    assert len(response.body) == 2